@@ -8,6 +8,13 @@ class TaskSchedulerDAG:
             self.graph[task_name] = []
             self.in_degree[task_name] = 0
 
+    def copy(self):
+        # Independent copy so callers can mutate without touching a shared graph
+        clone = TaskSchedulerDAG()
+        clone.graph = {task: list(deps) for task, deps in self.graph.items()}
+        clone.in_degree = self.in_degree.copy()
+        return clone
+
     def add_dependency(self, prerequisite_task, dependent_task):
         # Ensure tasks exist
         if prerequisite_task not in self.graph:
@@ -60,9 +67,8 @@ class TaskSchedulerDAG:
 
 
 # --- Example Usage ---
-scheduler = TaskSchedulerDAG()
-
 if __name__ == "__main__":
+    scheduler = TaskSchedulerDAG()
     while True:
         try:
             print("1. Add a task")
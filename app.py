@@ -1,9 +1,5 @@
 import streamlit as st
 from DAG import TaskSchedulerDAG
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import networkx as nx
 
 # 1. Page Config (MUST be first st command)
 st.set_page_config(
@@ -129,12 +125,14 @@ html, body, [class*="st-"] {
 # Initialize TaskSchedulerDAG and session state
 if "scheduler" not in st.session_state:
     st.session_state.scheduler = TaskSchedulerDAG()
+    st.session_state.scheduler_is_shared = False
 
     # COMMENT THESE LINES IF YOU DONT WANT TO USE DUMMY DATA
     # ------ #
     from dummy import load_dummy_data_into_session
 
     st.session_state.scheduler = load_dummy_data_into_session()
+    st.session_state.scheduler_is_shared = True  # copied on first edit
     # ------ #
 
     st.session_state.new_task_name_value = ""
@@ -155,6 +153,15 @@ if st.session_state.clear_dependency_inputs:
     st.session_state.dependent_task_value = ""
     st.session_state.clear_dependency_inputs = False
 
+
+def editable_scheduler():
+    # The dummy scenario is shared across sessions, so take a private copy before editing it
+    if st.session_state.scheduler_is_shared:
+        st.session_state.scheduler = st.session_state.scheduler.copy()
+        st.session_state.scheduler_is_shared = False
+    return st.session_state.scheduler
+
+
 # Header
 st.markdown(
     """
@@ -212,7 +219,7 @@ with st.sidebar:
     if st.button("Add Task", key="add_task_btn", use_container_width=True):
         if new_task_name.strip():
             if new_task_name not in st.session_state.scheduler.graph:
-                st.session_state.scheduler.add_task(new_task_name)
+                editable_scheduler().add_task(new_task_name)
                 st.success(f"✅ Task '{new_task_name}' added successfully!")
                 st.session_state.clear_new_task_input = True
                 st.rerun()
@@ -238,7 +245,7 @@ with st.sidebar:
         if st.button("Add Dependency", key="add_dep_btn", use_container_width=True):
             if prerequisite and dependent:
                 try:
-                    st.session_state.scheduler.add_dependency(
+                    editable_scheduler().add_dependency(
                         prerequisite, dependent)
                     st.success(
                         f"✅ Dependency added: {prerequisite} → {dependent}")
@@ -369,6 +376,10 @@ else:
         if st.session_state.show_graph and tasks:
             st.markdown("### Task Dependency Graph")
 
+            # Imported on demand so cold start doesn't pay for the graph stack
+            import plotly.graph_objects as go
+            import networkx as nx
+
             # Create network graph using networkx and plotly
             G = nx.DiGraph()
 
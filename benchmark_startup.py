@@ -0,0 +1,121 @@
+"""Startup benchmark for the task scheduler.
+
+Measures cold import time of DAG.py and app.py's time to first render, and
+checks that the visualization stack is not loaded until it is needed.
+
+    python benchmark_startup.py [--runs N] [--max-import-ms MS] [--max-render-ms MS]
+
+Every measurement runs in a fresh interpreter so it reflects a cold start.
+Exits 1 on a failed check and 2 if streamlit is missing and checks were skipped.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(ROOT, "app.py")
+HEAVY_MODULES = ("plotly", "networkx")
+
+RENDER_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({app_path!r}).run()
+elapsed = (time.perf_counter() - start) * 1000
+if app.exception:
+    sys.exit(f"app.py raised during render: {{app.exception}}")
+print(elapsed, ",".join(m for m in {heavy_modules!r} if m in sys.modules))
+"""
+
+
+def measure_import(module, runs):
+    """Import `module` in a fresh interpreter `runs` times, return timings in ms"""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; "
+        "print((time.perf_counter() - t) * 1000)"
+    )
+    timings = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", code], cwd=ROOT, text=True
+        )
+        timings.append(float(output.strip()))
+    return timings
+
+
+def render_cold():
+    """Render app.py once in a fresh interpreter.
+
+    Returns the time from importing streamlit to the end of the first render
+    in ms, and the heavy modules that render loaded.
+    """
+    code = RENDER_SCRIPT.format(app_path=APP_PATH, heavy_modules=HEAVY_MODULES)
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], cwd=ROOT, text=True
+    )
+    ms, _, loaded = output.strip().partition(" ")
+    return float(ms), [m for m in loaded.split(",") if m]
+
+
+def measure_first_render(runs):
+    """Cold-render app.py `runs` times (graph toggle off).
+
+    Returns timings in ms and the heavy modules loaded by any of the renders.
+    """
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        ms, modules = render_cold()
+        timings.append(ms)
+        loaded.update(modules)
+    return timings, sorted(loaded)
+
+
+def report(label, timings):
+    median = statistics.median(timings)
+    print(f"{label:<24} median {median:8.1f} ms   min {min(timings):8.1f} ms")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-render-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    failures = []
+
+    dag_import = report("import DAG", measure_import("DAG", args.runs))
+    if args.max_import_ms is not None and dag_import > args.max_import_ms:
+        failures.append(f"DAG import took {dag_import:.1f} ms")
+
+    try:
+        import streamlit  # noqa: F401
+    except ImportError:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        print(
+            "SKIPPED first render benchmark and lazy-import check: "
+            "streamlit is not installed"
+        )
+        return 2
+
+    timings, loaded = measure_first_render(args.runs)
+    render = report("first render of app.py", timings)
+    if args.max_render_ms is not None and render > args.max_render_ms:
+        failures.append(f"first render took {render:.1f} ms")
+    if loaded:
+        failures.append(f"loaded at startup: {', '.join(loaded)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,33 @@
 from DAG import TaskSchedulerDAG
+from collections import OrderedDict
+import os
 import random
+import sys
+import threading
+import warnings
+
+FALLBACK_MAX_BYTES = 64 * 1024 * 1024
+
+
+def max_bytes_from_env(default=FALLBACK_MAX_BYTES):
+    """Read the cache budget from SCENARIO_CACHE_MAX_BYTES, falling back on bad values"""
+    value = os.environ.get("SCENARIO_CACHE_MAX_BYTES")
+    if value is None:
+        return default
+    try:
+        max_bytes = int(value)
+    except ValueError:
+        max_bytes = -1
+    if max_bytes < 0:
+        warnings.warn(
+            f"Invalid SCENARIO_CACHE_MAX_BYTES '{value}', using {default} bytes."
+        )
+        return default
+    return max_bytes
+
+
+# Upper bound (in bytes) on the memory held by the shared scenario cache
+DEFAULT_MAX_BYTES = max_bytes_from_env()
 
 
 def create_software_development_project():
@@ -76,13 +104,110 @@ def create_software_development_project():
     return scheduler
 
 
+def estimate_graph_size(scheduler):
+    """Rough estimate of the memory used by a scheduler's graph, in bytes"""
+    size = sys.getsizeof(scheduler.graph) + sys.getsizeof(scheduler.in_degree)
+    for task, deps in scheduler.graph.items():
+        size += sys.getsizeof(task) + sys.getsizeof(deps)
+    return size
+
+
+class ScenarioRegistry:
+    """Registry of named scenario graphs, built lazily and kept in an LRU cache.
+
+    Loaded graphs are shared by every session in the process and must be
+    treated as read-only; callers copy a graph before modifying it.
+    Least recently used graphs are evicted once the estimated size of the
+    cache exceeds `max_bytes`. The budget covers only the cache: a session
+    keeps its graph alive after eviction, and its private copy once it edits.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._builders = {}
+        self._cache = OrderedDict()  # name -> (scheduler, size)
+        self._total_bytes = 0
+        self._loading = {}  # name -> lock held while that graph is being built
+        self._lock = threading.Lock()
+
+    def register(self, name, builder):
+        """Register a zero-argument function that builds a TaskSchedulerDAG"""
+        with self._lock:
+            self._builders[name] = builder
+            self._drop(name)
+
+    def names(self):
+        with self._lock:
+            return list(self._builders)
+
+    def loaded_names(self):
+        with self._lock:
+            return list(self._cache)
+
+    def get(self, name):
+        """Return the shared, read-only graph for a scenario, loading it if needed"""
+        with self._lock:
+            scheduler = self._lookup(name)
+            if scheduler is not None:
+                return scheduler
+            name_lock = self._loading.setdefault(name, threading.Lock())
+
+        # Build outside the registry lock so sessions reading other graphs aren't
+        # blocked; the per-name lock stops the same graph being built twice
+        with name_lock:
+            with self._lock:
+                scheduler = self._lookup(name)
+                if scheduler is not None:
+                    return scheduler
+                builder = self._builders[name]
+
+            try:
+                scheduler = builder()
+                size = estimate_graph_size(scheduler)
+                with self._lock:
+                    if self._builders.get(name) is builder:
+                        self._cache[name] = (scheduler, size)
+                        self._total_bytes += size
+                        self._evict(keep=name)
+                    return scheduler
+            finally:
+                with self._lock:
+                    if self._loading.get(name) is name_lock:
+                        del self._loading[name]
+
+    def _lookup(self, name):
+        # Caller must hold self._lock
+        if name not in self._builders:
+            raise KeyError(f"Scenario '{name}' is not registered.")
+        if name in self._cache:
+            self._cache.move_to_end(name)
+            return self._cache[name][0]
+        return None
+
+    def _drop(self, name):
+        entry = self._cache.pop(name, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    def _evict(self, keep):
+        # Never evict the graph that was just requested, even if it alone exceeds the budget
+        while self._total_bytes > self.max_bytes and len(self._cache) > 1:
+            oldest = next(iter(self._cache))
+            if oldest == keep:
+                break
+            self._drop(oldest)
+
+
+# Process-wide registry shared by all Streamlit sessions
+registry = ScenarioRegistry()
+registry.register("software", create_software_development_project)
+
+
 def load_dummy_data_into_session(scenario_name="software"):
-    """Load dummy data into Streamlit session state"""
-    scenarios = {
-        "software": create_software_development_project,
-    }
-
-    if scenario_name in scenarios:
-        return scenarios[scenario_name]()
-    else:
-        return create_software_development_project()
+    """Load dummy data into Streamlit session state.
+
+    Returns the shared graph; copy it before the session modifies it.
+    """
+    if scenario_name not in registry.names():
+        scenario_name = "software"
+    return registry.get(scenario_name)
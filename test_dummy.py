@@ -0,0 +1,140 @@
+import threading
+import time
+
+import pytest
+
+from DAG import TaskSchedulerDAG
+from dummy import (
+    ScenarioRegistry,
+    estimate_graph_size,
+    load_dummy_data_into_session,
+    max_bytes_from_env,
+)
+
+
+def make_builder(tasks, calls=None):
+    def build():
+        if calls is not None:
+            calls.append(tasks)
+        scheduler = TaskSchedulerDAG()
+        for task in tasks:
+            scheduler.add_task(task)
+        return scheduler
+
+    return build
+
+
+def graph_size(tasks):
+    return estimate_graph_size(make_builder(tasks)())
+
+
+def test_get_builds_lazily_and_caches():
+    calls = []
+    registry = ScenarioRegistry()
+    registry.register("a", make_builder(["x"], calls))
+    assert calls == []
+
+    first = registry.get("a")
+    assert registry.get("a") is first
+    assert len(calls) == 1
+
+
+def test_unknown_scenario_raises():
+    with pytest.raises(KeyError):
+        ScenarioRegistry().get("missing")
+
+
+def test_evicts_least_recently_used():
+    size = graph_size(["x"])
+    registry = ScenarioRegistry(max_bytes=2 * size)
+    for name in "abc":
+        registry.register(name, make_builder(["x"]))
+
+    registry.get("a")
+    registry.get("b")
+    registry.get("a")  # "b" is now the least recently used
+    registry.get("c")
+    assert registry.loaded_names() == ["a", "c"]
+
+
+def test_keeps_oversized_entry_just_loaded():
+    registry = ScenarioRegistry(max_bytes=1)
+    registry.register("a", make_builder(["x"]))
+    registry.register("b", make_builder(["y"]))
+
+    registry.get("a")
+    registry.get("b")
+    assert registry.loaded_names() == ["b"]
+
+
+def test_reregister_drops_cached_entry():
+    registry = ScenarioRegistry()
+    registry.register("a", make_builder(["x"]))
+    old = registry.get("a")
+
+    registry.register("a", make_builder(["y"]))
+    assert registry.loaded_names() == []
+    assert registry.get("a") is not old
+    assert list(registry.get("a").graph) == ["y"]
+
+
+def test_concurrent_get_builds_once_without_blocking_others():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_build():
+        calls.append("slow")
+        started.set()
+        release.wait(5)
+        return make_builder(["x"])()
+
+    registry = ScenarioRegistry()
+    registry.register("slow", slow_build)
+    registry.register("fast", make_builder(["y"]))
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("slow")))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+
+    # Other graphs are still served while "slow" is being built
+    start = time.perf_counter()
+    registry.get("fast")
+    assert time.perf_counter() - start < 1
+
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert calls == ["slow"]
+    assert results[0] is results[1]
+
+
+def test_copy_is_isolated_from_shared_graph():
+    shared = load_dummy_data_into_session()
+    assert load_dummy_data_into_session() is shared
+    before = {task: list(deps) for task, deps in shared.graph.items()}
+
+    session = shared.copy()
+    session.add_task("Extra Task")
+    session.add_dependency("Go Live", "Extra Task")
+
+    assert shared.graph == before
+    assert "Extra Task" not in shared.in_degree
+    assert session.get_execution_order()[-1] == "Extra Task"
+
+
+@pytest.mark.parametrize("value", ["lots", "-5"])
+def test_invalid_env_budget_falls_back(monkeypatch, value):
+    monkeypatch.setenv("SCENARIO_CACHE_MAX_BYTES", value)
+    with pytest.warns(UserWarning):
+        assert max_bytes_from_env(default=123) == 123
+
+
+def test_env_budget_is_read(monkeypatch):
+    monkeypatch.setenv("SCENARIO_CACHE_MAX_BYTES", "4096")
+    assert max_bytes_from_env() == 4096